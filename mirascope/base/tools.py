@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Generic, Type, TypeVar, Union
+from typing import Any, Callable, ClassVar, Generic, Optional, Type, TypeVar, Union
 
 from pydantic import BaseModel, ConfigDict
 from pydantic.json_schema import SkipJsonSchema
@@ -35,9 +35,14 @@ class BaseTool(BaseModel, Generic[ToolCallT], ABC):
     implementing a class that extends `BaseTool`, you must include the original
     `tool_call` from which this till was instantiated. Make sure to skip `tool_call`
     when generating the schema by annotating it with `SkipJsonSchema`.
+
+    Providers whose tool schema nests the function schema under a type key (e.g.
+    `{"type": "function", "function": {...}}`) can set `schema_wrapper` to that type
+    instead of re-wrapping the schema in their own `tool_schema`.
     """
 
     tool_call: SkipJsonSchema[ToolCallT]
+    schema_wrapper: ClassVar[Optional[str]] = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -65,6 +70,8 @@ class BaseTool(BaseModel, Generic[ToolCallT], ABC):
         if model_schema["properties"]:
             fn["parameters"] = model_schema
 
+        if cls.schema_wrapper:
+            return {"type": cls.schema_wrapper, cls.schema_wrapper: fn}
         return fn
 
     @classmethod
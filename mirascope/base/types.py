@@ -17,7 +17,6 @@ from pydantic import BaseModel, ConfigDict
 from typing_extensions import Required, TypedDict
 
 from .tools import BaseTool
-from .utils import convert_function_to_tool
 
 
 class SystemMessage(TypedDict, total=False):
@@ -117,8 +116,7 @@ class BaseCallParams(BaseModel, Generic[BaseToolT]):
         if not self.tools or tool_type is None:
             return kwargs
         kwargs["tools"] = [
-            tool if isclass(tool) else convert_function_to_tool(tool, tool_type)
-            for tool in self.tools
+            tool if isclass(tool) else tool_type.from_fn(tool) for tool in self.tools
         ]
         return kwargs
 
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any, Callable, Type
+from copy import deepcopy
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Optional, Type
 
+# Not a `TYPE_CHECKING` import: it parametrizes `BaseTool` below, so pydantic needs
+# the actual class to build the `tool_call` field.
 from groq.types.chat.chat_completion import ChoiceMessageToolCall
 from pydantic import BaseModel
+from pydantic_core import from_json
 
 from ..base import BaseTool, BaseType
 from ..base.utils import (
@@ -69,6 +73,9 @@ class GroqTool(BaseTool[ChoiceMessageToolCall]):
     #> Your favorite animal is the best one, a frog.
     '''
 
+    schema_wrapper: ClassVar[Optional[str]] = "function"
+    _tool_schema: ClassVar[dict[str, Any]]
+
     @classmethod
     def tool_schema(cls) -> dict[str, Any]:
         """Constructs a tool schema for use with the Groq Cloud API.
@@ -77,11 +84,15 @@ class GroqTool(BaseTool[ChoiceMessageToolCall]):
         are renamed to match the schema used to make functional/tool calls in the Groq
         Cloud API.
 
+        The schema only depends on the tool type, so it is constructed once per class.
+        Each call returns a copy, so callers are free to modify the result.
+
         Returns:
             The constructed tool schema.
         """
-        fn = super().tool_schema()
-        return {"type": "function", "function": fn}
+        if "_tool_schema" not in cls.__dict__:
+            cls._tool_schema = super().tool_schema()
+        return deepcopy(cls._tool_schema)
 
     @classmethod
     def from_tool_call(cls, tool_call: ChoiceMessageToolCall) -> GroqTool:
@@ -99,27 +110,67 @@ class GroqTool(BaseTool[ChoiceMessageToolCall]):
         Raises:
             ValueError: if the tool call doesn't match the tool schema.
         """
-        try:
-            model_json = {}
-            if tool_call.function and tool_call.function.arguments:
-                model_json = json.loads(tool_call.function.arguments)
-        except json.JSONDecodeError as e:
-            raise ValueError() from e
+        arguments = tool_call.function.arguments if tool_call.function else None
+        model_json = {}
+        if arguments:
+            try:
+                # The string cache costs more than it saves on small argument payloads.
+                model_json = from_json(arguments, cache_strings=False)
+            except ValueError as e:
+                raise ValueError(str(e)) from e
 
         model_json["tool_call"] = tool_call
         return cls.model_validate(model_json)
 
     @classmethod
     def from_model(cls, model: Type[BaseModel]) -> Type[GroqTool]:
-        """Constructs a `GroqTool` type from a `BaseModel` type."""
-        return convert_base_model_to_tool(model, GroqTool)
+        """Constructs a `GroqTool` type from a `BaseModel` type.
+
+        The constructed type is cached, so the same model always returns the same type.
+        The cache keeps strong references to the last 128 models, functions, and base
+        types converted by this class, along with their generated tool types.
+        """
+        return _to_tool(convert_base_model_to_tool, model)
 
     @classmethod
     def from_fn(cls, fn: Callable) -> Type[GroqTool]:
-        """Constructs a `GroqTool` type from a function."""
-        return convert_function_to_tool(fn, GroqTool)
+        """Constructs a `GroqTool` type from a function.
+
+        The constructed type is cached, so the same function always returns the same
+        type. The cache is shared with `from_model` and `from_base_type` and keeps
+        strong references to the cached functions, including their closures. A
+        function that is not hashable is converted without caching.
+        """
+        return _to_tool(convert_function_to_tool, fn)
 
     @classmethod
     def from_base_type(cls, base_type: Type[BaseType]) -> Type[GroqTool]:
-        """Constructs a `GroqTool` type from a `BaseType` type."""
-        return convert_base_type_to_tool(base_type, GroqTool)
+        """Constructs a `GroqTool` type from a `BaseType` type.
+
+        The constructed type is cached, so the same base type always returns the same
+        tool type. The cache is shared with `from_model` and `from_fn`.
+        """
+        return _to_tool(convert_base_type_to_tool, base_type)
+
+
+def _to_tool(
+    convert: Callable[[Any, Type[GroqTool]], Type[GroqTool]], source: Any
+) -> Type[GroqTool]:
+    """Converts `source` with `convert`, caching the result if `source` is hashable."""
+    try:
+        hash(source)
+    except TypeError:
+        return convert(source, GroqTool)
+    return _cached_tool(convert, source)
+
+
+@lru_cache
+def _cached_tool(
+    convert: Callable[[Any, Type[GroqTool]], Type[GroqTool]], source: Any
+) -> Type[GroqTool]:
+    """Returns the cached `GroqTool` type that `convert` constructs from `source`.
+
+    The default bound of 128 entries limits how many sources and generated types the
+    cache keeps alive.
+    """
+    return convert(source, GroqTool)
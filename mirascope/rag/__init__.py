@@ -20,4 +20,5 @@ __all__ = [
     "BaseQueryResults",
     "BaseVectorStoreParams",
     "Document",
+    "BaseVectorStore",
 ]
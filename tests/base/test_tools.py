@@ -20,6 +20,21 @@ def test_base_tool() -> None:
     assert "description" in tool_schema
 
 
+@patch.multiple(BaseTool, __abstractmethods__=set())
+def test_base_tool_schema_wrapper() -> None:
+    """Tests that `schema_wrapper` nests the schema under the wrapper type."""
+
+    class WrappedTool(BaseTool[str]):
+        """Test docstring"""
+
+        schema_wrapper = "function"
+
+    assert WrappedTool.tool_schema() == {
+        "type": "function",
+        "function": {"name": "WrappedTool", "description": "Test docstring"},
+    }
+
+
 @patch.multiple(BaseTool, __abstractmethods__=set())
 def test_extended_base_tool() -> None:
     """Tests a class that extends the `BaseTool` interface."""
@@ -1,10 +1,11 @@
 """Tests for the base typing classes."""
 
-from typing import Any
+from typing import Any, Callable, Type
 from unittest.mock import patch
 
 from mirascope.base.tools import BaseTool
 from mirascope.base.types import BaseCallParams
+from mirascope.base.utils import convert_function_to_tool
 
 
 def test_base_call_params_kwargs() -> None:
@@ -24,6 +25,10 @@ def test_base_call_params_kwargs_with_tools() -> None:
     class Tool(BaseTool):
         """A test tool"""
 
+        @classmethod
+        def from_fn(cls, fn: Callable) -> Type[BaseTool]:
+            return convert_function_to_tool(fn, cls)
+
     call_params = BaseCallParams[Tool](model="model", tools=[fn, Tool])
     kwargs = call_params.kwargs(Tool)  # type: ignore
     for tool in kwargs["tools"]:
@@ -1,11 +1,14 @@
 """Tests for the `mirascope.groq.tools` module."""
 
+from functools import update_wrapper
+from typing import Any, Callable
+
 import pytest
 from groq.types.chat.chat_completion import (
     ChoiceMessageToolCall,
     ChoiceMessageToolCallFunction,
 )
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from mirascope.base.tools import DEFAULT_TOOL_DOCSTRING
 from mirascope.groq.tools import GroqTool
@@ -42,6 +45,59 @@ class FakeTool(GroqTool):
     param: str = Field(..., description="A test parameter.")
 
 
+def test_tool_schema_is_cached_per_tool() -> None:
+    """Tests that `GroqTool.tool_schema` is constructed once per tool type."""
+
+    class OtherTool(FakeTool):
+        """Another test tool."""
+
+    schema = FakeTool.tool_schema()
+    assert schema == {
+        "type": "function",
+        "function": {
+            "name": "FakeTool",
+            "description": "A test tool.",
+            "parameters": {
+                "properties": {
+                    "param": {
+                        "description": "A test parameter.",
+                        "title": "Param",
+                        "type": "string",
+                    }
+                },
+                "required": ["param"],
+                "type": "object",
+            },
+        },
+    }
+    schema["function"]["parameters"]["properties"].clear()
+    assert FakeTool.tool_schema()["function"]["parameters"]["properties"] == {
+        "param": {
+            "description": "A test parameter.",
+            "title": "Param",
+            "type": "string",
+        }
+    }
+    assert OtherTool.tool_schema()["function"]["name"] == "OtherTool"
+
+
+def test_tool_schema_override_does_not_mutate_cache() -> None:
+    """Tests that an override editing `super().tool_schema()` keeps the cache intact."""
+
+    class StrictTool(FakeTool):
+        """A strict test tool."""
+
+        @classmethod
+        def tool_schema(cls) -> dict[str, Any]:
+            schema = super().tool_schema()
+            schema["function"]["strict"] = True
+            return schema
+
+    assert StrictTool.tool_schema()["function"]["strict"] is True
+    assert StrictTool.tool_schema()["function"]["strict"] is True
+    assert "strict" not in super(StrictTool, StrictTool).tool_schema()["function"]
+
+
 def test_tool_from_fn() -> None:
     """Tests converting a function into a `GroqTool`."""
     fake_tool("param")
@@ -50,6 +106,28 @@ def test_tool_from_fn() -> None:
     )
 
 
+def test_tool_from_fn_is_cached() -> None:
+    """Tests that converting the same function returns the same `GroqTool` type."""
+    assert GroqTool.from_fn(fake_tool) is GroqTool.from_fn(fake_tool)
+
+
+def test_tool_from_fn_unhashable() -> None:
+    """Tests that an unhashable function is converted without the cache."""
+
+    class Wrapper:
+        def __init__(self, fn: Callable) -> None:
+            update_wrapper(self, fn)
+
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, Wrapper)  # pragma: no cover
+
+        def __call__(self, *args: Any, **kwargs: Any) -> Any:
+            return self.__wrapped__(*args, **kwargs)  # pragma: no cover
+
+    tool_type = GroqTool.from_fn(Wrapper(fake_tool))
+    assert tool_type.model_json_schema() == FakeTool.model_json_schema()
+
+
 def test_tool_from_model() -> None:
     """Tests creating a `GroqTool` type from a `BaseModel`."""
 
@@ -60,6 +138,7 @@ def test_tool_from_model() -> None:
 
     tool_type = GroqTool.from_model(MyModel)
     assert tool_type.model_json_schema() == MyModel.model_json_schema()
+    assert GroqTool.from_model(MyModel) is tool_type
 
 
 def test_tool_from_base_type() -> None:
@@ -71,6 +150,46 @@ def test_tool_from_base_type() -> None:
         value: str
 
     assert GroqTool.from_base_type(str).model_json_schema() == Str.model_json_schema()
+    assert GroqTool.from_base_type(str) is GroqTool.from_base_type(str)
+
+
+def test_groq_tool_from_tool_call() -> None:
+    """Tests that `GroqTool.from_tool_call` attaches the original tool call."""
+    tool_call = ChoiceMessageToolCall(
+        id="id",
+        function=ChoiceMessageToolCallFunction(
+            arguments='{"param": "param"}', name="FakeTool"
+        ),
+        type="function",
+    )
+    tool = FakeTool.from_tool_call(tool_call)
+    assert isinstance(tool, FakeTool)
+    assert tool.args == {"param": "param"}
+    assert tool.tool_call is tool_call
+
+
+def test_groq_tool_from_tool_call_before_validator_sees_tool_call() -> None:
+    """Tests that a subclass before-validator receives the `tool_call` key."""
+    seen: list[Any] = []
+
+    class ValidatedTool(GroqTool):
+        param: str
+
+        @model_validator(mode="before")
+        @classmethod
+        def check_tool_call(cls, data: Any) -> Any:
+            seen.append(data["tool_call"])
+            return data
+
+    tool_call = ChoiceMessageToolCall(
+        id="id",
+        function=ChoiceMessageToolCallFunction(
+            arguments='{"param": "param"}', name="ValidatedTool"
+        ),
+        type="function",
+    )
+    ValidatedTool.from_tool_call(tool_call)
+    assert seen == [tool_call]
 
 
 def test_groq_tool_from_tool_call_json_decode_error():
@@ -82,5 +201,5 @@ def test_groq_tool_from_tool_call_json_decode_error():
         ),
         type="function",
     )
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="EOF while parsing"):
         FakeTool.from_tool_call(tool_call)
@@ -7,6 +7,7 @@ from groq.lib.chat_completion_chunk import ChatCompletionChunk
 from groq.types.chat.chat_completion import ChatCompletion
 
 from mirascope.groq import (
+    GroqCallParams,
     GroqCallResponse,
     GroqCallResponseChunk,
     GroqTool,
@@ -162,3 +163,20 @@ def test_groq_stream_response_with_tools(
         .choices[0]
         .delta.tool_calls
     )
+
+
+def test_groq_call_params_kwargs_reuses_tool_types() -> None:
+    """Tests that function tools convert to the cached `GroqTool` type per call."""
+
+    def my_tool(param: str) -> str:
+        """A test tool.
+
+        Args:
+            param: A test parameter.
+        """
+        return param  # pragma: no cover
+
+    call_params = GroqCallParams(tools=[my_tool])
+    tool_type = call_params.kwargs()["tools"][0]
+    assert call_params.kwargs()["tools"][0] is tool_type
+    assert GroqTool.from_fn(my_tool) is tool_type
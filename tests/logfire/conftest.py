@@ -1,4 +1,8 @@
 """Configuration for the Mirascope logfire module tests."""
+from contextlib import ExitStack
+from typing import Callable, Generator, Union
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
 import logfire
 import pytest
 from logfire.testing import CaptureLogfire, TestExporter
@@ -18,9 +22,9 @@ from mirascope.openai.calls import OpenAICall
 from mirascope.openai.types import OpenAICallParams
 
 
-@pytest.fixture(scope="function", autouse=True)
-def fixture_capfire() -> CaptureLogfire:
-    """A fixture that returns a CaptureLogfire instance."""
+@pytest.fixture(scope="session", autouse=True)
+def fixture_capfire_session() -> CaptureLogfire:
+    """A fixture that configures logfire once for the whole test session."""
     exporter = TestExporter()
     metrics_reader = InMemoryMetricReader()
     logfire.configure(
@@ -33,6 +37,44 @@ def fixture_capfire() -> CaptureLogfire:
     return CaptureLogfire(exporter=exporter, metrics_reader=metrics_reader)
 
 
+@pytest.fixture()
+def fixture_capfire(fixture_capfire_session: CaptureLogfire) -> CaptureLogfire:
+    """Returns the session `CaptureLogfire` with its span exporter cleared.
+
+    Unlike logfire's `capfire`, this does not reconfigure logfire, so the metrics reader
+    is shared by the whole session and keeps metrics from earlier tests.
+    """
+    fixture_capfire_session.exporter.clear()
+    return fixture_capfire_session
+
+
+# Cohere client methods shared by the tool call and parametrized `CohereCall` tests.
+_PROVIDER_PATCH_TARGETS: dict[
+    str, tuple[str, Union[type[MagicMock], type[AsyncMock]]]
+] = {
+    "cohere_chat": ("cohere.Client.chat", MagicMock),
+    "cohere_chat_async": ("cohere.AsyncClient.chat", AsyncMock),
+    "cohere_chat_stream": ("cohere.Client.chat_stream", MagicMock),
+    "cohere_chat_stream_async": ("cohere.AsyncClient.chat_stream", MagicMock),
+}
+
+
+@pytest.fixture()
+def fixture_mock_provider() -> Generator[Callable[[str], Mock], None, None]:
+    """Yields a factory that patches a provider method by name for the test.
+
+    Only the requested targets are patched, and all of them are undone together when
+    the test finishes.
+    """
+    with ExitStack() as stack:
+
+        def mock_provider(name: str) -> Mock:
+            target, new_callable = _PROVIDER_PATCH_TARGETS[name]
+            return stack.enter_context(patch(target, new_callable=new_callable))
+
+        yield mock_provider
+
+
 @pytest.fixture()
 def fixture_anthropic_test_call_with_logfire() -> type[AnthropicCall]:
     @with_logfire
@@ -1,17 +1,15 @@
 """Tests for the Mirascope + Logfire integration."""
 
-from typing import AsyncContextManager, ContextManager
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import AsyncContextManager, Callable, ContextManager
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from cohere import StreamedChatResponse_TextGeneration
-from cohere.types import NonStreamedChatResponse, StreamedChatResponse
+from cohere.types import NonStreamedChatResponse
 from google.ai.generativelanguage import GenerateContentResponse
 from groq.lib.chat_completion_chunk import ChatCompletionChunk
-from logfire import configure
-from logfire.testing import CaptureLogfire, TestExporter
+from logfire.testing import CaptureLogfire
 from openai.types.chat import ChatCompletion
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from pydantic import BaseModel
 
 from mirascope.anthropic.calls import AnthropicCall
@@ -41,13 +39,8 @@ def test_openai_call_with_logfire(
     mock_create: MagicMock,
     fixture_chat_completion: ChatCompletion,
     fixture_openai_nested_call: OpenAICall,
+    fixture_capfire: CaptureLogfire,
 ) -> None:
-    exporter = TestExporter()
-    configure(
-        send_to_logfire=False,
-        console=False,
-        processors=[SimpleSpanProcessor(exporter)],
-    )
     mock_create.return_value = fixture_chat_completion
     mock_create.__name__ = "call"
     fixture_openai_nested_call.call()
@@ -57,20 +50,19 @@ def test_openai_call_with_logfire(
         "MyNestedCall.call (pending)",
         "MyNestedCall.call",
     ]
-    span_names = [span.name for span in exporter.exported_spans]
+    span_names = [span.name for span in fixture_capfire.exporter.exported_spans]
     assert span_names == expected_span_names
 
 
-@patch("cohere.Client.chat", new_callable=MagicMock)
-@patch("cohere.AsyncClient.chat", new_callable=AsyncMock)
 @pytest.mark.asyncio
 async def test_tool_call_with_logfire(
-    mock_create: MagicMock,
-    mock_create_async: AsyncMock,
     fixture_book_tool: type[BookTool],
     fixture_cohere_response_with_tools: NonStreamedChatResponse,
-    capfire: CaptureLogfire,
+    fixture_mock_provider: Callable[[str], Mock],
+    fixture_capfire: CaptureLogfire,
 ) -> None:
+    mock_create = fixture_mock_provider("cohere_chat")
+    mock_create_async = fixture_mock_provider("cohere_chat_async")
     mock_create.return_value = fixture_cohere_response_with_tools
     mock_create.__name__ = "mock_create"
     mock_create_async.return_value = fixture_cohere_response_with_tools
@@ -86,7 +78,7 @@ async def test_tool_call_with_logfire(
     my_call = MyCohereCall()
     my_call.call()
     await my_call.call_async()
-    exporter = capfire.exporter
+    exporter = fixture_capfire.exporter
     expected_span_names = [
         "MyCohereCall.call (pending)",
         "cohere.wrapped with command-r-plus (pending)",
@@ -105,7 +97,7 @@ async def test_tool_call_with_logfire(
 def test_gemini_call_call(
     mock_generate_content: MagicMock,
     fixture_generate_content_response: GenerateContentResponse,
-    capfire: CaptureLogfire,
+    fixture_capfire: CaptureLogfire,
 ) -> None:
     """Tests that `GeminiClass.call` returns the expected response."""
     mock_generate_content.return_value = fixture_generate_content_response
@@ -117,7 +109,7 @@ def test_gemini_call_call(
 
     my_call = MyGeminiCall()
     my_call.call()
-    exporter = capfire.exporter
+    exporter = fixture_capfire.exporter
     expected_span_names = [
         "MyGeminiCall.call (pending)",
         "gemini.call with gemini-1.0-pro (pending)",
@@ -135,100 +127,80 @@ class CohereTempCall(CohereCall):
     call_params = CohereCallParams(preamble="test")
 
 
-@patch("cohere.Client.chat", new_callable=MagicMock)
-def test_cohere_call_call_with_logfire(
-    mock_chat: MagicMock,
-    fixture_non_streamed_response: NonStreamedChatResponse,
-    capfire: CaptureLogfire,
-) -> None:
-    """Tests that `CohereCall.call` returns the expected response with logfire."""
-    mock_chat.return_value = fixture_non_streamed_response
-    my_call = CohereTempCall()
-    my_call.call()
-    exporter = capfire.exporter
-    expected_span_names = [
-        "CohereTempCall.call (pending)",
-        "cohere.wrapped with command-r-plus (pending)",
-        "cohere.wrapped with command-r-plus",
-        "CohereTempCall.call",
-    ]
-    span_names = [span.name for span in exporter.exported_spans]
-    assert span_names == expected_span_names
-
-
-@patch("cohere.AsyncClient.chat", new_callable=AsyncMock)
+@pytest.mark.parametrize(
+    "method,provider,response_fixture,expected_span_names",
+    [
+        (
+            "call",
+            "cohere_chat",
+            "fixture_non_streamed_response",
+            [
+                "CohereTempCall.call (pending)",
+                "cohere.wrapped with command-r-plus (pending)",
+                "cohere.wrapped with command-r-plus",
+                "CohereTempCall.call",
+            ],
+        ),
+        (
+            "call_async",
+            "cohere_chat_async",
+            "fixture_non_streamed_response",
+            [
+                "CohereTempCall.call_async (pending)",
+                "cohere.wrapped with command-r-plus (pending)",
+                "cohere.wrapped with command-r-plus",
+                "CohereTempCall.call_async",
+            ],
+        ),
+        (
+            "stream",
+            "cohere_chat_stream",
+            "fixture_cohere_response_chunks",
+            [
+                "CohereTempCall.stream (pending)",
+                "streaming response from {request_data[model]!r} took {duration:.2f}s",
+                "CohereTempCall.stream",
+            ],
+        ),
+        (
+            "stream_async",
+            "cohere_chat_stream_async",
+            "fixture_cohere_async_response_chunks",
+            [
+                "CohereTempCall.stream_async (pending)",
+                "streaming response from {request_data[model]!r} took {duration:.2f}s",
+                "CohereTempCall.stream_async",
+            ],
+        ),
+    ],
+)
 @pytest.mark.asyncio
-async def test_cohere_call_call_async_with_logfire(
-    mock_chat: AsyncMock,
-    fixture_non_streamed_response: NonStreamedChatResponse,
-    capfire: CaptureLogfire,
-) -> None:
-    """Tests that `CohereCall.call_async` returns the expected response with logfire."""
-    mock_chat.return_value = fixture_non_streamed_response
-
-    my_call = CohereTempCall()
-    await my_call.call_async()
-    exporter = capfire.exporter
-    expected_span_names = [
-        "CohereTempCall.call_async (pending)",
-        "cohere.wrapped with command-r-plus (pending)",
-        "cohere.wrapped with command-r-plus",
-        "CohereTempCall.call_async",
-    ]
-    span_names = [span.name for span in exporter.exported_spans]
-    assert span_names == expected_span_names
-
-
-@patch("cohere.Client.chat_stream", new_callable=MagicMock)
-def test_cohere_call_stream_with_logfire(
-    mock_chat_stream: MagicMock,
-    fixture_cohere_response_chunks: list[StreamedChatResponse],
-    capfire: CaptureLogfire,
+async def test_cohere_call_with_logfire(
+    method: str,
+    provider: str,
+    response_fixture: str,
+    expected_span_names: list[str],
+    fixture_mock_provider: Callable[[str], Mock],
+    fixture_capfire: CaptureLogfire,
+    request: pytest.FixtureRequest,
 ) -> None:
-    """Tests that `CohereCall.stream` returns the expected response with logfire."""
-    mock_chat_stream.return_value = fixture_cohere_response_chunks
-    mock_chat_stream.__name__ = "stream"
+    """Tests that `CohereCall` methods return the expected response with logfire."""
+    mock_chat = fixture_mock_provider(provider)
+    mock_chat.return_value = request.getfixturevalue(response_fixture)
     my_call = CohereTempCall()
-    chunks = [chunk for chunk in my_call.stream()]
-    for chunk in chunks:
-        assert isinstance(chunk.chunk, StreamedChatResponse_TextGeneration)
-    exporter = capfire.exporter
-    expected_span_names = [
-        "CohereTempCall.stream (pending)",
-        "streaming response from {request_data[model]!r} took {duration:.2f}s",
-        "CohereTempCall.stream",
-    ]
-    span_names = [span.name for span in exporter.exported_spans]
-    assert span_names == expected_span_names
-
-
-@patch("cohere.AsyncClient.chat_stream", new_callable=MagicMock)
-@pytest.mark.asyncio
-async def test_cohere_call_stream_async_with_logfire(
-    mock_chat_stream: MagicMock,
-    fixture_cohere_async_response_chunks,
-    capfire: CaptureLogfire,
-):
-    """Tests `CohereCall.stream_async` returns expected response with logfire."""
-
-    @with_logfire
-    class TempCall(CohereCall):
-        prompt_template = ""
-        api_key = "test"
-
-    mock_chat_stream.return_value = fixture_cohere_async_response_chunks
-    mock_chat_stream.__name__ = "stream"
-    my_call = TempCall()
-    stream = my_call.stream_async()
-
-    async for chunk in stream:
-        assert isinstance(chunk.chunk, StreamedChatResponse_TextGeneration)
-    exporter = capfire.exporter
-    expected_span_names = [
-        "TempCall.stream_async (pending)",
-        "streaming response from {request_data[model]!r} took {duration:.2f}s",
-        "TempCall.stream_async",
-    ]
+    if method == "call":
+        my_call.call()
+    elif method == "call_async":
+        await my_call.call_async()
+    else:
+        mock_chat.__name__ = "stream"
+        if method == "stream":
+            for chunk in my_call.stream():
+                assert isinstance(chunk.chunk, StreamedChatResponse_TextGeneration)
+        else:
+            async for chunk in my_call.stream_async():
+                assert isinstance(chunk.chunk, StreamedChatResponse_TextGeneration)
+    exporter = fixture_capfire.exporter
     span_names = [span.name for span in exporter.exported_spans]
     assert span_names == expected_span_names
 
@@ -241,7 +213,7 @@ def test_anthropic_call_stream(
     mock_stream: MagicMock,
     fixture_anthropic_message_chunks: ContextManager[list],
     fixture_anthropic_test_call_with_logfire: type[AnthropicCall],
-    capfire: CaptureLogfire,
+    fixture_capfire: CaptureLogfire,
 ):
     """Tests `AnthropicPrompt.stream` returns the expected response when called."""
     mock_stream.return_value = fixture_anthropic_message_chunks
@@ -251,7 +223,7 @@ def test_anthropic_call_stream(
     stream = my_call.stream()
     for chunk in stream:
         assert isinstance(chunk, AnthropicCallResponseChunk)
-    exporter = capfire.exporter
+    exporter = fixture_capfire.exporter
     expected_span_names = [
         "AnthropicLogfireCall.stream (pending)",
         "AnthropicLogfireCall.stream",
@@ -269,7 +241,7 @@ async def test_anthropic_call_stream_async(
     mock_stream: MagicMock,
     fixture_anthropic_async_message_chunks: AsyncContextManager[list],
     fixture_anthropic_test_call_with_logfire: type[AnthropicCall],
-    capfire: CaptureLogfire,
+    fixture_capfire: CaptureLogfire,
 ):
     """Tests `AnthropicPrompt.stream_async` returns the expected response when called."""
     mock_stream.return_value = fixture_anthropic_async_message_chunks
@@ -279,7 +251,7 @@ async def test_anthropic_call_stream_async(
     stream = my_call.stream_async()
     async for chunk in stream:
         assert isinstance(chunk, AnthropicCallResponseChunk)
-    exporter = capfire.exporter
+    exporter = fixture_capfire.exporter
     expected_span_names = [
         "AnthropicLogfireCall.stream_async (pending)",
         "AnthropicLogfireCall.stream_async",
@@ -295,7 +267,7 @@ async def test_anthropic_call_stream_async(
 async def test_groq_call_stream_async(
     mock_create: AsyncMock,
     fixture_chat_completion_stream_response: list[ChatCompletionChunk],
-    capfire: CaptureLogfire,
+    fixture_capfire: CaptureLogfire,
 ):
     """Tests `GroqCall.stream_async` returns expected response with logfire."""
 
@@ -313,7 +285,7 @@ async def test_groq_call_stream_async(
     async for chunk in stream:
         pass
 
-    exporter = capfire.exporter
+    exporter = fixture_capfire.exporter
     expected_span_names = [
         "TempCall.stream_async (pending)",
         "streaming response from {request_data[model]!r} took {duration:.2f}s",
@@ -329,7 +301,7 @@ def test_extractor_with_logfire(
     fixture_chat_completion_with_tools: ChatCompletion,
     fixture_my_openai_tool: type[OpenAITool],
     fixture_my_openai_tool_schema: type[BaseModel],
-    capfire: CaptureLogfire,
+    fixture_capfire: CaptureLogfire,
 ) -> None:
     mock_call.return_value = OpenAICallResponse(
         response=fixture_chat_completion_with_tools,
@@ -347,7 +319,7 @@ def test_extractor_with_logfire(
 
     my_extractor = TempExtractor()
     my_extractor.extract()
-    exporter = capfire.exporter
+    exporter = fixture_capfire.exporter
     expected_span_names = [
         "TempExtractor.extract (pending)",
         # TODO: Figure out why this is not in the span, works fine outside test
@@ -379,14 +351,14 @@ class VectorStore(ChromaVectorStore):
 @patch("chromadb.api.models.Collection.Collection.upsert")
 def test_chroma_vectorstore_add_document(
     mock_upsert: MagicMock,
-    capfire: CaptureLogfire,
+    fixture_capfire: CaptureLogfire,
 ):
     """Test the add method of the ChromaVectorStore class with documents as argument"""
     mock_upsert.return_value = None
     my_vectorstore = VectorStore()
     my_vectorstore.add([Document(text="foo", id="1")])
     mock_upsert.assert_called_once_with(ids=["1"], documents=["foo"])
-    exporter = capfire.exporter
+    exporter = fixture_capfire.exporter
     expected_span_names = [
         "VectorStore.add (pending)",
         "VectorStore.add",
@@ -398,14 +370,14 @@ def test_chroma_vectorstore_add_document(
 @patch("chromadb.api.models.Collection.Collection.query")
 def test_chroma_vectorstore_retrieve(
     mock_query: MagicMock,
-    capfire: CaptureLogfire,
+    fixture_capfire: CaptureLogfire,
 ):
     """Test the retrieve method of the ChromaVectorStore class."""
     mock_query.return_value = ChromaQueryResult(ids=[["1"]])
     my_vectorstore = VectorStore()
     my_vectorstore.retrieve("test")
     mock_query.assert_called_once_with(query_texts=["test"])
-    exporter = capfire.exporter
+    exporter = fixture_capfire.exporter
     expected_span_names = [
         "VectorStore.retrieve (pending)",
         "VectorStore.retrieve",